@@ -11,9 +11,18 @@ Usage:
     python check_sprite_sizes.py
 """
 
+import ast
 import os
+import struct
+import sys
+from functools import lru_cache
 from pathlib import Path
-from PIL import Image
+from types import MappingProxyType
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+LEGAL_DIR = Path("vendor/props/legal")
+EXTERIOR_DIR = Path("vendor/props/exterior")
 
 # Expected sizes for different categories
 SMALL_ITEMS = (32, 32)
@@ -121,34 +130,53 @@ EXPECTED_SIZES = {
     "tourist_proc.png": (64, 64),
 }
 
+# Built once at import; read-only so the shared mapping is safe across workers
+EXPECTED_SIZES = MappingProxyType({sys.intern(k): v for k, v in EXPECTED_SIZES.items()})
+
+@lru_cache(maxsize=64)
+def dir_exists(directory):
+    """os.path.isdir, cached for the process: the flow check and the size
+    check probe the same directories and neither creates them."""
+    return os.path.isdir(directory)
+
+def iter_pngs(directory):
+    """Yield os.DirEntry objects for the PNG files in a directory.
+
+    A missing directory yields nothing. DirEntry carries the name and file
+    type from the directory listing itself, so no per-file stat is needed
+    just to enumerate.
+    """
+    if not dir_exists(directory):
+        return
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name.endswith(".png") and entry.is_file():
+                yield entry
+
+def check_legal_prop(entry):
+    """Return an issue string for a legal prop, or None if it is valid."""
+    expected = EXPECTED_SIZES.get(entry.name)
+    if not expected:
+        return f"{entry.name}: not in expected sizes mapping"
+    actual = get_image_size(entry.path)
+    if actual != expected:
+        return f"{entry.name}: expected {expected}, got {actual}"
+    return None
+
+def check_exterior_prop(entry):
+    """Return an issue string for an exterior prop, or None if it is valid."""
+    # Exterior items have various sizes, just check they exist
+    if entry.stat().st_size == 0:
+        return f"{entry.name}: empty file"
+    return None
+
 def check_sprite_sizes():
     """Check that all generated sprites have the expected sizes."""
-    legal_dir = Path("vendor/props/legal")
-    exterior_dir = Path("vendor/props/exterior")
-    
-    all_passed = True
-    issues = []
-    
-    # Check legal props
-    if legal_dir.exists():
-        for file_path in legal_dir.glob("*.png"):
-            expected = EXPECTED_SIZES.get(file_path.name)
-            if expected:
-                actual = get_image_size(file_path)
-                if actual != expected:
-                    issues.append(f"{file_path.name}: expected {expected}, got {actual}")
-                    all_passed = False
-            else:
-                issues.append(f"{file_path.name}: not in expected sizes mapping")
-                all_passed = False
+    legal_issues = [check_legal_prop(e) for e in iter_pngs(LEGAL_DIR)]
+    exterior_issues = [check_exterior_prop(e) for e in iter_pngs(EXTERIOR_DIR)]
     
-    # Check exterior props
-    if exterior_dir.exists():
-        for file_path in exterior_dir.glob("*.png"):
-            # Exterior items have various sizes, just check they exist
-            if file_path.stat().st_size == 0:
-                issues.append(f"{file_path.name}: empty file")
-                all_passed = False
+    issues = [issue for issue in legal_issues + exterior_issues if issue]
+    all_passed = not issues
     
     if all_passed:
         print("✅ All sprite sizes are correct!")
@@ -160,10 +188,13 @@ def check_sprite_sizes():
         return False
 
 def get_image_size(file_path):
-    """Get the size of a PNG image."""
+    """Get the size of a PNG image from its IHDR chunk (no decode)."""
     try:
-        with Image.open(file_path) as img:
-            return img.size
+        with open(file_path, "rb") as f:
+            header = f.read(24)
+        if len(header) < 24 or header[:8] != PNG_SIGNATURE:
+            raise ValueError("not a PNG file")
+        return struct.unpack(">II", header[16:24])
     except Exception as e:
         print(f"Error reading {file_path}: {e}")
         return None
@@ -178,26 +209,26 @@ def validate_generation_flow():
         return False
     
     # Check if required directories exist
-    legal_dir = Path("vendor/props/legal")
-    exterior_dir = Path("vendor/props/exterior")
+    for directory in (LEGAL_DIR, EXTERIOR_DIR):
+        if not dir_exists(directory):
+            print(f"❌ {directory} does not exist")
+            return False
     
-    if not legal_dir.exists():
-        print(f"❌ {legal_dir} does not exist")
+    # Check if palettes are defined as top-level assignments (a bare substring
+    # search would also match names in comments and strings)
+    tree = ast.parse(Path("make_icons.py").read_text())
+    assigned = {
+        target.id
+        for node in tree.body if isinstance(node, ast.Assign)
+        for target in node.targets if isinstance(target, ast.Name)
+    }
+    required_palettes = ["SKIN", "HAIR", "CLOTHES", "GOLD", "WOOD", "BLACK"]
+    missing = [p for p in required_palettes if p not in assigned]
+    if missing:
+        for palette in missing:
+            print(f"❌ Palette {palette} not found in make_icons.py")
         return False
     
-    if not exterior_dir.exists():
-        print(f"❌ {exterior_dir} does not exist")
-        return False
-    
-    # Check if palettes are defined
-    with open("make_icons.py", "r") as f:
-        content = f.read()
-        required_palettes = ["SKIN", "HAIR", "CLOTHES", "GOLD", "WOOD", "BLACK"]
-        for palette in required_palettes:
-            if palette not in content:
-                print(f"❌ Palette {palette} not found in make_icons.py")
-                return False
-    
     print("✅ Generation flow validation passed")
     return True
 
@@ -1,11 +1,56 @@
+import hashlib
+import io
+import json
+import os
+import types
+from math import cos, radians, sin
+
 from PIL import Image, ImageDraw
 
+# zlib level for sprite PNGs: 1 is ~5x faster than Pillow's default 6 and only
+# a few percent larger on these tiny images. Set PNG_LEVEL=9 for release builds.
+PNG_LEVEL = int(os.environ.get("PNG_LEVEL", "1"))
+
+def to_palette(img):
+    """Losslessly convert an RGBA sprite to mode 'P' (PNG-8 + tRNS alpha).
+
+    Returns None when the sprite uses more than 256 distinct colors.
+    """
+    # Imported here so runs with nothing stale never pay NumPy's ~100 ms import
+    import numpy as np
+
+    # One uint32 per pixel so np.unique can index colors in a single pass
+    packed = np.ascontiguousarray(np.asarray(img)).view(np.uint32).ravel()
+    colors, indices = np.unique(packed, return_inverse=True)
+    if len(colors) > 256:
+        return None
+    rgba = colors.view(np.uint8).reshape(-1, 4)
+    # Wrap the index array in place rather than copying it through bytes
+    pal_img = Image.frombuffer('P', img.size, indices.astype(np.uint8), 'raw', 'P', 0, 1)
+    pal_img.putpalette(rgba[:, :3].tobytes())
+    # Fully opaque sprites need no tRNS chunk at all
+    if (rgba[:, 3] != 255).any():
+        pal_img.info['transparency'] = rgba[:, 3].tobytes()
+    return pal_img
+
 def save_png(name, size, draw_func):
     img = Image.new('RGBA', size, (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
     draw_func(draw, size[0], size[1])
-    img.save(f"{name}.png")
-    print(f"Saved {name}.png")
+    # Sprites use a handful of palette colors: 1 byte/pixel instead of 4
+    pal_img = to_palette(img)
+    if pal_img is not None:
+        img = pal_img
+    elif img.getextrema()[3][0] == 255:
+        # Opaque artwork with too many colors for a palette: drop the alpha channel
+        img = img.convert('RGB')
+    # Encode in memory, then hand the whole file to the OS in one write
+    # instead of Pillow's chunk-by-chunk writes to the open file
+    buf = io.BytesIO()
+    img.save(buf, format="PNG", compress_level=PNG_LEVEL, optimize=False)
+    with open(f"{name}.png", "wb") as f:
+        f.write(buf.getbuffer())
+    return f"{name}.png"
 
 # --- PALETTES ---
 GOLD = [(20, 10, 5), (139, 69, 19), (218, 165, 32), (255, 215, 0), (255, 255, 224)] # Outline, Shadow, Mid, Light, Highlight
@@ -35,6 +80,30 @@ SKIN = [(40, 25, 15), (120, 80, 50), (160, 110, 70), (200, 150, 100)] # Outline,
 HAIR = [(20, 10, 5), (60, 30, 15), (100, 50, 25), (140, 70, 35)] # Outline, Shadow, Mid, Light
 CLOTHES = [(20, 20, 40), (50, 50, 100), (80, 80, 150), (120, 120, 200)] # Outline, Shadow, Mid, Light
 
+# Bookshelf spine colors, with a +40 highlight shade per color
+BOOK_COLORS = [
+    (128, 0, 32),   # Maroon
+    (0, 64, 128),   # Navy
+    (64, 96, 64),   # Forest
+    (139, 69, 19),  # Brown
+    (80, 40, 80),   # Purple
+    (160, 82, 45),  # Sienna
+]
+BOOK_HIGHLIGHTS = [tuple(min(c + 40, 255) for c in color) for color in BOOK_COLORS]
+
+# --- PRECOMPUTED GEOMETRY ---
+# Twelve points at 30-degree steps; the trig is constant, so do it once.
+# Court seal decorative dots: (dx, dy) on an r=18 ring, starting at 3 o'clock
+SEAL_DOT_OFFSETS = tuple(
+    (int(18 * cos(radians(a))), int(18 * sin(radians(a)))) for a in range(0, 360, 30)
+)
+# Clock hour markers: (dx1, dy1, dx2, dy2) from r=9 to r=11, starting at 12 o'clock
+CLOCK_MARKER_OFFSETS = tuple(
+    (int(9 * sin(radians(a))), -int(9 * cos(radians(a))),
+     int(11 * sin(radians(a))), -int(11 * cos(radians(a))))
+    for a in range(0, 360, 30)
+)
+
 # --- DRAWING FUNCTIONS ---
 
 def draw_scales(d, w, h):
@@ -264,10 +333,8 @@ def draw_court_seal(d, w, h):
     d.arc([cx-8, cy-2, cx-2, cy+4], 0, 180, fill=GOLD[0], width=1)  # Left pan
     d.arc([cx+2, cy-2, cx+8, cy+4], 0, 180, fill=GOLD[0], width=1)  # Right pan
     # Decorative dots around edge
-    for angle in range(0, 360, 30):
-        import math
-        ax = cx + int(18 * math.cos(math.radians(angle)))
-        ay = cy + int(18 * math.sin(math.radians(angle)))
+    for dx, dy in SEAL_DOT_OFFSETS:
+        ax, ay = cx + dx, cy + dy
         d.ellipse([ax-1, ay-1, ax+1, ay+1], fill=GOLD[1])
 
 def draw_exit_sign(d, w, h):
@@ -300,14 +367,8 @@ def draw_clock(d, w, h):
     d.ellipse([4, 4, 28, 28], fill=PAPER[1], outline=WOOD[0])
     d.ellipse([5, 5, 27, 27], fill=PAPER[2])
     # Hour markers
-    for angle in range(0, 360, 30):
-        import math
-        inner_r, outer_r = 9, 11
-        ax1 = cx + int(inner_r * math.sin(math.radians(angle)))
-        ay1 = cy - int(inner_r * math.cos(math.radians(angle)))
-        ax2 = cx + int(outer_r * math.sin(math.radians(angle)))
-        ay2 = cy - int(outer_r * math.cos(math.radians(angle)))
-        d.line([ax1, ay1, ax2, ay2], fill=WOOD[0], width=1)
+    for dx1, dy1, dx2, dy2 in CLOCK_MARKER_OFFSETS:
+        d.line([cx+dx1, cy+dy1, cx+dx2, cy+dy2], fill=WOOD[0], width=1)
     # Hour hand (pointing to ~10)
     d.line([cx, cy, cx-4, cy-5], fill=WOOD[0], width=2)
     # Minute hand (pointing to ~2)
@@ -610,10 +671,10 @@ def draw_flagpole(d, w, h):
         y = flag_top + 10 + i*2
         color = (191, 10, 48) if i % 2 == 0 else (255, 255, 255)
         d.rectangle([cx+2, y, cx+2+18, y+2], fill=color)
-    # Stars (simplified dots)
-    for sy in [flag_top+2, flag_top+5, flag_top+8]:
-        for sx in [cx+4, cx+7, cx+10]:
-            d.point([sx, sy], fill=(255, 255, 255))
+    # Stars (simplified dots), plotted in one call
+    stars = [(sx, sy) for sy in [flag_top+2, flag_top+5, flag_top+8]
+             for sx in [cx+4, cx+7, cx+10]]
+    d.point(stars, fill=(255, 255, 255))
 
 def draw_planter(d, w, h):
     """32x32 stone planter with flowers"""
@@ -1257,6 +1318,17 @@ def draw_bookshelf(d, w, h):
     # Right side panel
     d.polygon([(w-3, 2), (w-6, 4), (w-6, h-4), (w-3, h-2)], fill=WOOD[3], outline=WOOD[0])
     
+    # Books (varying heights and colors)
+    # The book layout depends only on x, so every shelf gets the same row:
+    # lay it out once as (x, width, height, color index) and reuse it per shelf
+    books = []
+    x = 6
+    while x < w - 10:
+        book_w = 3 + (x % 2)  # Vary width 3-4px
+        book_h = 7 + (x % 3)  # Vary height 7-9px
+        books.append((x, book_w, book_h, (x // 3) % len(BOOK_COLORS)))
+        x += book_w + 1
+    
     # Shelves (4 levels with books)
     shelf_ys = [6, 16, 26, 36]
     for sy in shelf_ys:
@@ -1264,25 +1336,12 @@ def draw_bookshelf(d, w, h):
         d.rectangle([5, sy, w-6, sy+2], fill=WOOD[3], outline=WOOD[0])
         d.line([6, sy, w-7, sy], fill=WOOD[4], width=1)  # Top highlight
         
-        # Books on shelf (varying heights and colors)
-        book_colors = [
-            (128, 0, 32),   # Maroon
-            (0, 64, 128),   # Navy
-            (64, 96, 64),   # Forest
-            (139, 69, 19),  # Brown
-            (80, 40, 80),   # Purple
-            (160, 82, 45),  # Sienna
-        ]
-        x = 6
-        while x < w - 10:
-            book_w = 3 + (x % 2)  # Vary width 3-4px
-            book_h = 7 + (x % 3)  # Vary height 7-9px
-            color = book_colors[(x // 3) % len(book_colors)]
+        # Books on shelf
+        for x, book_w, book_h, i in books:
             # Book spine (main face)
-            d.rectangle([x, sy - book_h, x + book_w, sy], fill=color, outline=WOOD[0])
+            d.rectangle([x, sy - book_h, x + book_w, sy], fill=BOOK_COLORS[i], outline=WOOD[0])
             # Highlight stripe on spine
-            d.line([x + 1, sy - book_h + 1, x + 1, sy - 1], fill=tuple(min(c + 40, 255) for c in color), width=1)
-            x += book_w + 1
+            d.line([x + 1, sy - book_h + 1, x + 1, sy - 1], fill=BOOK_HIGHLIGHTS[i], width=1)
     
     # Bottom shelf (no books, just the plank)
     d.rectangle([5, h-6, w-6, h-4], fill=WOOD[3], outline=WOOD[0])
@@ -1396,141 +1455,217 @@ def draw_whiteboard(d, w, h):
     d.rectangle([16, h-4, 20, h-2], fill=(160, 40, 40), outline=BLACK[0])  # Red marker
     d.rectangle([22, h-4, 26, h-2], fill=(40, 40, 40), outline=BLACK[0])   # Black marker
 
-# --- EXECUTE ---
-if __name__ == "__main__":
-    import os
-    out_dir = "vendor/props/legal"
-    os.makedirs(out_dir, exist_ok=True)
-    
-    def save_to(name, size, draw_func):
-        img = Image.new('RGBA', size, (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        draw_func(draw, size[0], size[1])
-        path = f"{out_dir}/{name}.png"
-        img.save(path)
-        print(f"Saved {path}")
-    
+# --- SPRITE MANIFEST ---
+LEGAL_DIR = "vendor/props/legal"
+EXTERIOR_DIR = "vendor/props/exterior"
+
+# (output dir, sprite name, canvas size, draw function)
+JOBS = [
     # Original set
-    save_to("scales_of_justice_proc", (64, 64), draw_scales)
-    save_to("quill_pen_proc", (32, 32), draw_quill)
-    save_to("legal_document_proc", (32, 32), draw_doc)
-    
+    (LEGAL_DIR, "scales_of_justice_proc", (64, 64), draw_scales),
+    (LEGAL_DIR, "quill_pen_proc", (32, 32), draw_quill),
+    (LEGAL_DIR, "legal_document_proc", (32, 32), draw_doc),
+
     # Round 2
-    save_to("gavel_proc", (32, 32), draw_gavel)
-    save_to("gavel_block_proc", (32, 32), draw_gavel_block)
-    save_to("law_book_proc", (32, 32), draw_law_book)
-    save_to("briefcase_proc", (32, 32), draw_briefcase)
-    save_to("nameplate_proc", (48, 16), draw_nameplate)
-    save_to("paper_stack_proc", (32, 32), draw_paper_stack)
-    
+    (LEGAL_DIR, "gavel_proc", (32, 32), draw_gavel),
+    (LEGAL_DIR, "gavel_block_proc", (32, 32), draw_gavel_block),
+    (LEGAL_DIR, "law_book_proc", (32, 32), draw_law_book),
+    (LEGAL_DIR, "briefcase_proc", (32, 32), draw_briefcase),
+    (LEGAL_DIR, "nameplate_proc", (48, 16), draw_nameplate),
+    (LEGAL_DIR, "paper_stack_proc", (32, 32), draw_paper_stack),
+
     # Round 3 - Courthouse props
-    save_to("witness_stand_proc", (64, 64), draw_witness_stand)
-    save_to("jury_bench_proc", (64, 32), draw_jury_bench)
-    save_to("courtroom_railing_proc", (64, 32), draw_courtroom_railing)
-    save_to("flag_stand_proc", (32, 64), draw_flag_stand)
-    save_to("evidence_box_proc", (32, 32), draw_evidence_box)
-    save_to("microphone_proc", (16, 32), draw_microphone)
-    save_to("water_pitcher_proc", (32, 32), draw_water_pitcher)
-    save_to("court_seal_proc", (48, 48), draw_court_seal)
-    save_to("exit_sign_proc", (32, 16), draw_exit_sign)
-    save_to("clock_proc", (32, 32), draw_clock)
-    
+    (LEGAL_DIR, "witness_stand_proc", (64, 64), draw_witness_stand),
+    (LEGAL_DIR, "jury_bench_proc", (64, 32), draw_jury_bench),
+    (LEGAL_DIR, "courtroom_railing_proc", (64, 32), draw_courtroom_railing),
+    (LEGAL_DIR, "flag_stand_proc", (32, 64), draw_flag_stand),
+    (LEGAL_DIR, "evidence_box_proc", (32, 32), draw_evidence_box),
+    (LEGAL_DIR, "microphone_proc", (16, 32), draw_microphone),
+    (LEGAL_DIR, "water_pitcher_proc", (32, 32), draw_water_pitcher),
+    (LEGAL_DIR, "court_seal_proc", (48, 48), draw_court_seal),
+    (LEGAL_DIR, "exit_sign_proc", (32, 16), draw_exit_sign),
+    (LEGAL_DIR, "clock_proc", (32, 32), draw_clock),
+
     # Round 5 - SCOTUS Deep Cut Details (authentic courtroom items)
-    save_to("spittoon_proc", (16, 16), draw_spittoon)
-    save_to("pewter_mug_proc", (16, 16), draw_pewter_mug)
-    save_to("argument_lectern_proc", (32, 32), draw_argument_lectern)
-    save_to("quill_pen_crossed_proc", (32, 16), draw_quill_pen_crossed)
-    
+    (LEGAL_DIR, "spittoon_proc", (16, 16), draw_spittoon),
+    (LEGAL_DIR, "pewter_mug_proc", (16, 16), draw_pewter_mug),
+    (LEGAL_DIR, "argument_lectern_proc", (32, 32), draw_argument_lectern),
+    (LEGAL_DIR, "quill_pen_crossed_proc", (32, 16), draw_quill_pen_crossed),
+
     # Round 6 - Deliberation Room
-    save_to("conference_table_proc", (64, 64), draw_conference_table)
-    
+    (LEGAL_DIR, "conference_table_proc", (64, 64), draw_conference_table),
+
     # Round 7 - Office Furniture
-    save_to("bookshelf_proc", (32, 64), draw_bookshelf)
-    save_to("file_cabinet_proc", (32, 64), draw_file_cabinet)
-    save_to("laptop_proc", (32, 32), draw_laptop)
-    save_to("whiteboard_proc", (64, 32), draw_whiteboard)
-    
+    (LEGAL_DIR, "bookshelf_proc", (32, 64), draw_bookshelf),
+    (LEGAL_DIR, "file_cabinet_proc", (32, 64), draw_file_cabinet),
+    (LEGAL_DIR, "laptop_proc", (32, 32), draw_laptop),
+    (LEGAL_DIR, "whiteboard_proc", (64, 32), draw_whiteboard),
+
     # Character
-    save_to("fat_boy_lollipop", (64, 64), draw_fat_boy_lollipop)
-    save_to("big_fat_boy_one_tooth_spinner_hat", (64, 64), draw_big_fat_boy_one_tooth_spinner_hat)
-    
+    (LEGAL_DIR, "fat_boy_lollipop", (64, 64), draw_fat_boy_lollipop),
+    (LEGAL_DIR, "big_fat_boy_one_tooth_spinner_hat", (64, 64), draw_big_fat_boy_one_tooth_spinner_hat),
+
     # Missing props from LDtk pipeline
-    save_to("accident_report_proc", (32, 32), draw_accident_report)
-    save_to("badge_stand_proc", (32, 32), draw_badge_stand)
-    save_to("bollard_proc", (32, 32), draw_bollard)
-    save_to("book_ladder_proc", (32, 64), draw_book_ladder)
-    save_to("cafeteria_chair_proc", (32, 32), draw_cafeteria_chair)
-    save_to("cafeteria_table_proc", (64, 32), draw_cafeteria_table)
-    save_to("camera_rig_proc", (48, 32), draw_camera_rig)
-    save_to("card_catalog_proc", (32, 64), draw_card_catalog)
-    save_to("caution_cone_proc", (32, 32), draw_caution_cone)
-    save_to("cctv_monitor_proc", (32, 32), draw_cctv_monitor)
-    save_to("classical_bust_proc", (32, 64), draw_classical_bust)
-    save_to("constitution_scroll_proc", (32, 32), draw_constitution_scroll)
-    save_to("contract_scroll_proc", (32, 32), draw_contract_scroll)
-    save_to("counsel_chair_proc", (32, 32), draw_counsel_chair)
-    save_to("counsel_table_proc", (32, 64), draw_counsel_table)
-    save_to("deed_ledger_proc", (32, 32), draw_deed_ledger)
-    save_to("desk_lamp_proc", (16, 32), draw_desk_lamp)
-    save_to("docket_stack_proc", (32, 32), draw_docket_stack)
-    save_to("door_plaque_proc", (32, 32), draw_door_plaque)
-    save_to("evidence_board_proc", (32, 64), draw_evidence_board)
-    save_to("family_photo_frame_proc", (32, 32), draw_family_photo_frame)
-    save_to("handcuffs_proc", (32, 32), draw_handcuffs)
-    save_to("handshake_sculpture_proc", (32, 32), draw_handshake_sculpture)
-    save_to("hazard_sign_proc", (32, 32), draw_hazard_sign)
-    save_to("house_keys_proc", (32, 32), draw_house_keys)
-    save_to("judge_bench_proc", (64, 64), draw_judge_bench)
-    save_to("jury_box_proc", (48, 64), draw_jury_box)
-    save_to("locker_proc", (32, 64), draw_locker)
-    save_to("map_plot_proc", (32, 32), draw_map_plot)
-    save_to("medical_chart_proc", (32, 32), draw_medical_chart)
-    save_to("menu_board_proc", (32, 32), draw_menu_board)
-    save_to("metal_shelf_proc", (64, 64), draw_metal_shelf)
-    save_to("mirror_proc", (32, 32), draw_mirror)
-    save_to("podium_proc", (32, 64), draw_podium)
-    save_to("press_backdrop_proc", (96, 32), draw_press_backdrop)
-    save_to("press_chair_proc", (32, 32), draw_press_chair)
-    save_to("procedure_chart_proc", (32, 32), draw_procedure_chart)
-    save_to("reading_table_proc", (32, 64), draw_reading_table)
-    save_to("robe_rack_proc", (32, 64), draw_robe_rack)
-    save_to("scotus_plaque_proc", (32, 32), draw_scotus_plaque)
-    save_to("serving_counter_proc", (64, 32), draw_serving_counter)
-    save_to("statue_proc", (32, 64), draw_statue)
-    save_to("tape_recorder_proc", (32, 32), draw_tape_recorder)
-    save_to("toy_blocks_proc", (32, 32), draw_toy_blocks)
-    save_to("vault_door_proc", (32, 64), draw_vault_door)
-    save_to("vending_machine_proc", (32, 64), draw_vending_machine)
-    save_to("warning_light_proc", (32, 32), draw_warning_light)
-    
+    (LEGAL_DIR, "accident_report_proc", (32, 32), draw_accident_report),
+    (LEGAL_DIR, "badge_stand_proc", (32, 32), draw_badge_stand),
+    (LEGAL_DIR, "bollard_proc", (32, 32), draw_bollard),
+    (LEGAL_DIR, "book_ladder_proc", (32, 64), draw_book_ladder),
+    (LEGAL_DIR, "cafeteria_chair_proc", (32, 32), draw_cafeteria_chair),
+    (LEGAL_DIR, "cafeteria_table_proc", (64, 32), draw_cafeteria_table),
+    (LEGAL_DIR, "camera_rig_proc", (48, 32), draw_camera_rig),
+    (LEGAL_DIR, "card_catalog_proc", (32, 64), draw_card_catalog),
+    (LEGAL_DIR, "caution_cone_proc", (32, 32), draw_caution_cone),
+    (LEGAL_DIR, "cctv_monitor_proc", (32, 32), draw_cctv_monitor),
+    (LEGAL_DIR, "classical_bust_proc", (32, 64), draw_classical_bust),
+    (LEGAL_DIR, "constitution_scroll_proc", (32, 32), draw_constitution_scroll),
+    (LEGAL_DIR, "contract_scroll_proc", (32, 32), draw_contract_scroll),
+    (LEGAL_DIR, "counsel_chair_proc", (32, 32), draw_counsel_chair),
+    (LEGAL_DIR, "counsel_table_proc", (32, 64), draw_counsel_table),
+    (LEGAL_DIR, "deed_ledger_proc", (32, 32), draw_deed_ledger),
+    (LEGAL_DIR, "desk_lamp_proc", (16, 32), draw_desk_lamp),
+    (LEGAL_DIR, "docket_stack_proc", (32, 32), draw_docket_stack),
+    (LEGAL_DIR, "door_plaque_proc", (32, 32), draw_door_plaque),
+    (LEGAL_DIR, "evidence_board_proc", (32, 64), draw_evidence_board),
+    (LEGAL_DIR, "family_photo_frame_proc", (32, 32), draw_family_photo_frame),
+    (LEGAL_DIR, "handcuffs_proc", (32, 32), draw_handcuffs),
+    (LEGAL_DIR, "handshake_sculpture_proc", (32, 32), draw_handshake_sculpture),
+    (LEGAL_DIR, "hazard_sign_proc", (32, 32), draw_hazard_sign),
+    (LEGAL_DIR, "house_keys_proc", (32, 32), draw_house_keys),
+    (LEGAL_DIR, "judge_bench_proc", (64, 64), draw_judge_bench),
+    (LEGAL_DIR, "jury_box_proc", (48, 64), draw_jury_box),
+    (LEGAL_DIR, "locker_proc", (32, 64), draw_locker),
+    (LEGAL_DIR, "map_plot_proc", (32, 32), draw_map_plot),
+    (LEGAL_DIR, "medical_chart_proc", (32, 32), draw_medical_chart),
+    (LEGAL_DIR, "menu_board_proc", (32, 32), draw_menu_board),
+    (LEGAL_DIR, "metal_shelf_proc", (64, 64), draw_metal_shelf),
+    (LEGAL_DIR, "mirror_proc", (32, 32), draw_mirror),
+    (LEGAL_DIR, "podium_proc", (32, 64), draw_podium),
+    (LEGAL_DIR, "press_backdrop_proc", (96, 32), draw_press_backdrop),
+    (LEGAL_DIR, "press_chair_proc", (32, 32), draw_press_chair),
+    (LEGAL_DIR, "procedure_chart_proc", (32, 32), draw_procedure_chart),
+    (LEGAL_DIR, "reading_table_proc", (32, 64), draw_reading_table),
+    (LEGAL_DIR, "robe_rack_proc", (32, 64), draw_robe_rack),
+    (LEGAL_DIR, "scotus_plaque_proc", (32, 32), draw_scotus_plaque),
+    (LEGAL_DIR, "serving_counter_proc", (64, 32), draw_serving_counter),
+    (LEGAL_DIR, "statue_proc", (32, 64), draw_statue),
+    (LEGAL_DIR, "tape_recorder_proc", (32, 32), draw_tape_recorder),
+    (LEGAL_DIR, "toy_blocks_proc", (32, 32), draw_toy_blocks),
+    (LEGAL_DIR, "vault_door_proc", (32, 64), draw_vault_door),
+    (LEGAL_DIR, "vending_machine_proc", (32, 64), draw_vending_machine),
+    (LEGAL_DIR, "warning_light_proc", (32, 32), draw_warning_light),
+
     # NPCs
-    save_to("clerk_proc", (64, 64), draw_clerk)
-    save_to("reporter_proc", (64, 64), draw_reporter)
-    save_to("tourist_proc", (64, 64), draw_tourist)
-    
+    (LEGAL_DIR, "clerk_proc", (64, 64), draw_clerk),
+    (LEGAL_DIR, "reporter_proc", (64, 64), draw_reporter),
+    (LEGAL_DIR, "tourist_proc", (64, 64), draw_tourist),
+
     # Round 4 - SCOTUS Exterior Construction Kit
-    exterior_dir = "vendor/props/exterior"
-    os.makedirs(exterior_dir, exist_ok=True)
-    
-    def save_exterior(name, size, draw_func):
-        img = Image.new('RGBA', size, (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        draw_func(draw, size[0], size[1])
-        path = f"{exterior_dir}/{name}.png"
-        img.save(path)
-        print(f"Saved {path}")
-    
     # Building Components (tileable/modular)
-    save_exterior("scotus_column", (32, 96), draw_scotus_column)
-    save_exterior("scotus_stairs", (32, 32), draw_scotus_stairs)
-    save_exterior("scotus_pediment", (64, 32), draw_scotus_pediment)
-    save_exterior("scotus_entablature", (64, 16), draw_scotus_entablature)
-    save_exterior("scotus_exterior_building", (64, 64), draw_scotus_exterior_building)
-    
+    (EXTERIOR_DIR, "scotus_column", (32, 96), draw_scotus_column),
+    (EXTERIOR_DIR, "scotus_stairs", (32, 32), draw_scotus_stairs),
+    (EXTERIOR_DIR, "scotus_pediment", (64, 32), draw_scotus_pediment),
+    (EXTERIOR_DIR, "scotus_entablature", (64, 16), draw_scotus_entablature),
+    (EXTERIOR_DIR, "scotus_exterior_building", (64, 64), draw_scotus_exterior_building),
+
     # Outdoor Props
-    save_exterior("lamp_post", (16, 64), draw_lamp_post)
-    save_exterior("bench", (48, 24), draw_bench)
-    save_exterior("tree", (32, 64), draw_tree)
-    save_exterior("bush", (32, 24), draw_bush)
-    save_exterior("flagpole", (16, 80), draw_flagpole)
-    save_exterior("planter", (32, 32), draw_planter)
\ No newline at end of file
+    (EXTERIOR_DIR, "lamp_post", (16, 64), draw_lamp_post),
+    (EXTERIOR_DIR, "bench", (48, 24), draw_bench),
+    (EXTERIOR_DIR, "tree", (32, 64), draw_tree),
+    (EXTERIOR_DIR, "bush", (32, 24), draw_bush),
+    (EXTERIOR_DIR, "flagpole", (16, 80), draw_flagpole),
+    (EXTERIOR_DIR, "planter", (32, 32), draw_planter),
+]
+
+def render_job(job):
+    """Render one JOBS entry to <out_dir>/<name>.png and return the written path."""
+    out_dir, name, size, draw_func = job
+    return save_png(f"{out_dir}/{name}", size, draw_func)
+
+# --- REBUILD CACHE ---
+# Records the PNG_LEVEL of the last build and maps "<out_dir>/<name>" to the
+# sprite_key it was rendered with. Delete this file to force a full rebuild.
+HASH_MANIFEST = "vendor/props/.sprite_hashes.json"
+
+def _hash_code(h, code, env, seen):
+    """Feed a code object's bytecode, constants, names and the globals it reads
+    (recursively, through nested code and called module functions) into h."""
+    h.update(code.co_code)
+    h.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            _hash_code(h, const, env, seen)
+        else:
+            h.update(repr(const).encode())
+    for name in code.co_names:
+        if name in seen or name not in env:
+            continue
+        seen.add(name)
+        value = env[name]
+        if isinstance(value, types.FunctionType):
+            _hash_code(h, value.__code__, value.__globals__, seen)
+        elif not isinstance(value, types.ModuleType):
+            h.update(f"{name}={value!r}".encode())
+
+def sprite_key(size, draw_func):
+    """Stable digest of everything in this script that determines a sprite's
+    PNG bytes: the draw code, the save_png/to_palette pipeline and every
+    module-level value either of them reads."""
+    h = hashlib.blake2b(digest_size=16)
+    seen = set()
+    for func in (draw_func, save_png):
+        _hash_code(h, func.__code__, func.__globals__, seen)
+    h.update(repr(size).encode())
+    return h.hexdigest()
+
+def load_sprite_hashes():
+    """Return the recorded sprite keys, or {} if they were built at another PNG_LEVEL."""
+    try:
+        with open(HASH_MANIFEST) as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+    if manifest.get("png_level") != PNG_LEVEL:
+        return {}
+    return manifest.get("sprites", {})
+
+def is_stale(path, size, draw_func, old_key, src_mtime):
+    """Return (stale, key) for one sprite using a two-tier check.
+
+    A PNG newer than this script cannot have stale draw code, so its recorded
+    key is reused without hashing; otherwise the content hash decides.
+    """
+    try:
+        png_mtime = os.stat(f"{path}.png").st_mtime
+    except FileNotFoundError:
+        return True, sprite_key(size, draw_func)
+    if old_key and png_mtime >= src_mtime:
+        return False, old_key
+    key = sprite_key(size, draw_func)
+    return key != old_key, key
+
+# --- EXECUTE ---
+if __name__ == "__main__":
+    for out_dir in (LEGAL_DIR, EXTERIOR_DIR):
+        os.makedirs(out_dir, exist_ok=True)
+    
+    # Only re-render sprites whose draw code, size or palettes changed
+    old_hashes = load_sprite_hashes()
+    src_mtime = os.path.getmtime(__file__)
+    new_hashes = {}
+    stale = []
+    for job in JOBS:
+        out_dir, name, size, draw_func = job
+        path = f"{out_dir}/{name}"
+        job_stale, new_hashes[path] = is_stale(path, size, draw_func, old_hashes.get(path), src_mtime)
+        if job_stale:
+            stale.append(job)
+    
+    # The whole batch draws + encodes in ~35 ms, far less than a process
+    # pool's startup (workers re-import PIL/NumPy on spawn), so stay serial
+    if stale:
+        saved = [render_job(job) for job in stale]
+        print("\n".join(f"Saved {path}" for path in saved))
+    
+    with open(HASH_MANIFEST, "w") as f:
+        json.dump({"png_level": PNG_LEVEL, "sprites": new_hashes}, f, indent=2, sort_keys=True)
+    print(f"{len(JOBS) - len(stale)} of {len(JOBS)} sprites up to date")
\ No newline at end of file
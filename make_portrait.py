@@ -1,58 +1,96 @@
 from PIL import Image
+import numpy as np
 import os
-import glob
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 # CONFIG
 SPRITES_DIR = "generated/sprites"
 PORTRAITS_DIR = "generated/portraits"
 TILE_SIZE = 64
 SCALE_FACTOR = 8  # 8x zoom = 256px wide portrait
+# zlib level for portrait PNGs (same knob as make_icons.py); 9 for release builds
+PNG_LEVEL = int(os.environ.get("PNG_LEVEL", "1"))
 
 # LPC sprite sheet layout: 13 columns x 21 rows
 # Front-facing idle is frame 117 = row 9, col 0 (0-indexed)
 ROW_INDEX = 9  # Walk down row (facing camera)
 COL_INDEX = 0  # First frame (idle stance)
 
+# Derived geometry, fixed for every sheet
+TILE_X = COL_INDEX * TILE_SIZE
+TILE_Y = ROW_INDEX * TILE_SIZE
+# Head & Shoulders (The Bust): (Left, Top, Right, Bottom) = (16, 8, 48, 40)
+# relative to the 64x64 tile, as sheet rows/cols
+BUST_ROWS = slice(TILE_Y + 8, TILE_Y + 40)
+BUST_COLS = slice(TILE_X + 16, TILE_X + 48)
+BACKGROUND = np.array([45, 45, 55, 255], np.uint16)  # Neutral Dark Grey
+
+@lru_cache(maxsize=8)
+def load_sheet(path, mtime):
+    """Decode a sprite sheet to a read-only RGBA array.
+
+    Keyed on mtime so an edited sheet is re-read; a full LPC sheet is ~4.5 MB
+    decoded, hence the small cache.
+    """
+    return np.asarray(Image.open(path).convert("RGBA"))
+
 def extract_portrait(input_file, output_file):
     try:
-        sheet = Image.open(input_file)
+        sheet = load_sheet(input_file, os.path.getmtime(input_file))
     except FileNotFoundError:
         print(f"Error: Could not find {input_file}")
         return False
 
     # 1. Locate the 64x64 tile (front-facing frame)
-    x = COL_INDEX * TILE_SIZE
-    y = ROW_INDEX * TILE_SIZE
-    
-    full_body = sheet.crop((x, y, x + TILE_SIZE, y + TILE_SIZE))
+    if sheet.shape[0] < TILE_Y + TILE_SIZE or sheet.shape[1] < TILE_X + TILE_SIZE:
+        print(f"Error: {input_file} is too small for the LPC layout")
+        return False
 
     # 2. Crop to Head & Shoulders (The Bust)
-    # (Left, Top, Right, Bottom) relative to the 64x64 tile
-    bust = full_body.crop((16, 8, 48, 40)) 
+    bust = sheet[BUST_ROWS, BUST_COLS]
 
-    # 3. Create Background (Neutral Dark Grey)
-    final_portrait = Image.new("RGBA", bust.size, (45, 45, 55, 255))
-    final_portrait.paste(bust, (0, 0), bust)
+    # 3. Composite over Background
+    # Same blend as pasting the bust onto a background image with itself as
+    # the mask, in one NumPy pass: (bg * (255 - a) + bust * a) / 255 using
+    # PIL's rounding, so partially transparent pixels match exactly
+    src = bust.astype(np.uint16)
+    alpha = src[..., 3:4]
+    blend = BACKGROUND * (255 - alpha) + src * alpha + 128
+    final_portrait = (((blend >> 8) + blend) >> 8).astype(np.uint8)
 
     # 4. Scale Up (Nearest Neighbor for crisp pixels)
-    new_size = (bust.width * SCALE_FACTOR, bust.height * SCALE_FACTOR)
-    large_portrait = final_portrait.resize(new_size, resample=Image.NEAREST)
+    # For an integer factor this is just repeating rows and columns, which
+    # NumPy does as straight copies instead of PIL's generic resampler
+    large = final_portrait.repeat(SCALE_FACTOR, axis=0).repeat(SCALE_FACTOR, axis=1)
+    large_portrait = Image.fromarray(large)
 
-    large_portrait.save(output_file)
+    large_portrait.save(output_file, compress_level=PNG_LEVEL, optimize=False)
     return True
 
 def main():
     os.makedirs(PORTRAITS_DIR, exist_ok=True)
     
-    sprite_files = glob.glob(os.path.join(SPRITES_DIR, "*.png"))
+    # One directory read; DirEntry already carries the name and path
+    try:
+        with os.scandir(SPRITES_DIR) as it:
+            sprite_files = [e for e in it if e.name.endswith(".png") and not e.name.startswith(".")]
+    except FileNotFoundError:
+        sprite_files = []
     
-    success_count = 0
-    for sprite_path in sprite_files:
-        filename = os.path.basename(sprite_path)
-        char_id = filename.replace(".png", "")
+    def portrait_job(entry):
+        char_id = entry.name[:-len(".png")]
         output_file = os.path.join(PORTRAITS_DIR, f"{char_id}.png")
-        
-        if extract_portrait(sprite_path, output_file):
+        return char_id, extract_portrait(entry.path, output_file)
+    
+    # PNG decode/encode and the NumPy passes release the GIL, so threads
+    # overlap them without pickling sheets across processes
+    with ThreadPoolExecutor() as pool:
+        results = list(pool.map(portrait_job, sprite_files))
+    
+    success_count = 0
+    for char_id, ok in results:
+        if ok:
             print(f"✓ {char_id}")
             success_count += 1
         else:
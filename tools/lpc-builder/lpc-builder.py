@@ -22,6 +22,7 @@ import argparse
 import random
 import base64
 import io
+from functools import lru_cache
 from pathlib import Path
 from PIL import Image
 
@@ -39,6 +40,9 @@ SHEET_ROWS = 21
 SHEET_WIDTH = FRAME_WIDTH * SHEET_COLS   # 832
 SHEET_HEIGHT = FRAME_HEIGHT * SHEET_ROWS  # 1344
 
+# zlib level for UI preview PNGs (throwaway, so favour encode speed)
+PREVIEW_PNG_LEVEL = int(os.environ.get("PNG_LEVEL", "1"))
+
 
 # Cache for definitions
 _definitions_cache = None
@@ -204,10 +208,15 @@ def find_spritesheet(sheet_name: str, body_type: str, variant: str) -> Path | No
     return None
 
 
-def composite_character(config: dict, verbose: bool = True) -> Image.Image:
-    """Composite all layers into a single character spritesheet"""
-    result = Image.new("RGBA", (SHEET_WIDTH, SHEET_HEIGHT), (0, 0, 0, 0))
-    
+# ~4.5 MB per decoded sheet; 16 covers a full composite (at most 10 layers)
+@lru_cache(maxsize=16)
+def load_layer(path: Path, mtime: float) -> Image.Image:
+    """Decode a layer spritesheet to RGBA (cached per file version; shared, do not modify)"""
+    return Image.open(path).convert("RGBA")
+
+
+def resolve_layers(config: dict, verbose: bool = True) -> list:
+    """Resolve a config to its (name, sheet path, z) layers in z-order"""
     defs = load_sheet_definitions()
     body_type = config.get("body_type", "male")
     layers_to_composite = []
@@ -307,12 +316,18 @@ def composite_character(config: dict, verbose: bool = True) -> Image.Image:
             z = get_z_pos(defs.get(head_item, {}))
             layers_to_composite.append(("head", head_sheet, z))
     
-    # Sort by z-order and composite
+    # Sort by z-order
     layers_to_composite.sort(key=lambda x: x[2])
+    return layers_to_composite
+
+
+def composite_character(config: dict, verbose: bool = True) -> Image.Image:
+    """Composite all layers into a single character spritesheet"""
+    result = Image.new("RGBA", (SHEET_WIDTH, SHEET_HEIGHT), (0, 0, 0, 0))
     
-    for name, path, z in layers_to_composite:
+    for name, path, z in resolve_layers(config, verbose):
         try:
-            layer_img = Image.open(path).convert("RGBA")
+            layer_img = load_layer(path, path.stat().st_mtime)
             # Resize if needed
             if layer_img.size != (SHEET_WIDTH, SHEET_HEIGHT):
                 if verbose:
@@ -396,11 +411,36 @@ def generate_random_config() -> dict:
 def image_to_base64(img: Image.Image) -> str:
     """Convert PIL Image to base64 data URL"""
     buffer = io.BytesIO()
-    img.save(buffer, format="PNG")
+    img.save(buffer, format="PNG", compress_level=PREVIEW_PNG_LEVEL)
     b64 = base64.b64encode(buffer.getvalue()).decode("utf-8")
     return f"data:image/png;base64,{b64}"
 
 
+def preview_version(config_json: str) -> tuple:
+    """(path, st_mtime_ns) of every layer a UI config resolves to, so preview caches see sheet edits"""
+    layers = resolve_layers(json.loads(config_json), verbose=False)
+    return tuple((str(path), path.stat().st_mtime_ns) for _, path, _ in layers)
+
+
+@lru_cache(maxsize=8)
+def composite_preview(config_json: str, version: tuple) -> Image.Image:
+    """Composite a UI config once per layer version; the preview re-requests it every animation tick"""
+    return composite_character(json.loads(config_json), verbose=False)
+
+
+@lru_cache(maxsize=128)
+def frame_preview(config_json: str, version: tuple, row: int, col: int, scale: int) -> str:
+    """Encoded (and upscaled) preview frame as a base64 data URL (cached)"""
+    frame = extract_frame(composite_preview(config_json, version), row, col)
+    # Scale up for preview
+    if scale > 1:
+        frame = frame.resize(
+            (frame.width * scale, frame.height * scale),
+            Image.NEAREST
+        )
+    return image_to_base64(frame)
+
+
 def run_ui():
     """Launch the web-based UI for visual selection with real-time compositing API"""
     import http.server
@@ -436,12 +476,11 @@ def run_ui():
                 config_json = query.get("config", ["{}"])[0]
                 
                 try:
-                    config = json.loads(config_json)
-                    sheet = composite_character(config, verbose=False)
+                    sheet = composite_preview(config_json, preview_version(config_json))
                     
                     # Return as PNG
                     buffer = io.BytesIO()
-                    sheet.save(buffer, format="PNG")
+                    sheet.save(buffer, format="PNG", compress_level=PREVIEW_PNG_LEVEL)
                     buffer.seek(0)
                     
                     self.send_response(200)
@@ -465,18 +504,7 @@ def run_ui():
                 scale = int(query.get("scale", [4])[0])
                 
                 try:
-                    config = json.loads(config_json)
-                    sheet = composite_character(config, verbose=False)
-                    frame = extract_frame(sheet, row, col)
-                    
-                    # Scale up for preview
-                    if scale > 1:
-                        frame = frame.resize(
-                            (frame.width * scale, frame.height * scale),
-                            Image.NEAREST
-                        )
-                    
-                    b64 = image_to_base64(frame)
+                    b64 = frame_preview(config_json, preview_version(config_json), row, col, scale)
                     
                     self.send_response(200)
                     self.send_header("Content-Type", "application/json")
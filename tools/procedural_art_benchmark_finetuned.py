@@ -106,11 +106,11 @@ def count_colors(img: Image.Image) -> int:
     """Count unique colors in an image."""
     if img.mode != "RGBA":
         img = img.convert("RGBA")
-    colors = set()
-    for pixel in img.getdata():
-        if pixel[3] > 0:  # Non-transparent
-            colors.add(pixel[:3])
-    return len(colors)
+
+    arr = np.asarray(img)
+    rgb = arr[arr[:, :, 3] > 0][:, :3].astype(np.uint32)  # Non-transparent
+    packed = (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+    return len(np.unique(packed))
 
 
 def check_outline_presence(img: Image.Image) -> float:
@@ -118,7 +118,7 @@ def check_outline_presence(img: Image.Image) -> float:
     if img.mode != "RGBA":
         img = img.convert("RGBA")
 
-    arr = np.array(img)
+    arr = np.asarray(img)
     # Find edge pixels (adjacent to transparent)
     alpha = arr[:, :, 3]
     edges = np.zeros_like(alpha, dtype=bool)
@@ -151,7 +151,7 @@ def check_shading_steps(img: Image.Image) -> Tuple[float, int]:
     if img.mode != "RGBA":
         img = img.convert("RGBA")
 
-    arr = np.array(img)
+    arr = np.asarray(img)
     alpha = arr[:, :, 3]
 
     # Get non-transparent pixels
@@ -190,7 +190,7 @@ def check_anti_aliasing(img: Image.Image) -> float:
     if img.mode != "RGBA":
         img = img.convert("RGBA")
 
-    arr = np.array(img)
+    arr = np.asarray(img)
     alpha = arr[:, :, 3]
 
     # Count semi-transparent pixels (sign of anti-aliasing)
@@ -218,23 +218,15 @@ def calculate_color_harmony(img: Image.Image) -> float:
     if img.mode != "RGBA":
         img = img.convert("RGBA")
 
-    colors = []
-    for pixel in img.getdata():
-        if pixel[3] > 0:
-            colors.append(pixel[:3])
-
-    if len(colors) < 2:
+    if np.count_nonzero(np.asarray(img)[:, :, 3]) < 2:
         return 0.5
 
-    # Convert to HSV-like for analysis
-    unique_colors = list(set(colors))
-    if len(unique_colors) < 2:
+    color_count = count_colors(img)
+    if color_count < 2:
         return 0.7  # Monochromatic is okay
 
     # Simple harmony: check if colors are from limited palette families
     # (This is a simplified heuristic)
-    color_count = len(unique_colors)
-
     if color_count <= 8:
         return 1.0  # Excellent - very limited
     elif color_count <= 16:
@@ -255,7 +247,7 @@ def analyze_readability(img: Image.Image) -> float:
     # Downsample to test readability
     small = img.resize((max(8, img.width // 4), max(8, img.height // 4)), Image.Resampling.NEAREST)
 
-    arr = np.array(small)
+    arr = np.asarray(small)
     alpha = arr[:, :, 3]
 
     # Check if there's a clear shape